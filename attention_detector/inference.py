@@ -9,7 +9,7 @@ import torch.nn.functional as F
 from torchvision import transforms
 
 from config import data_config
-from utils.helpers import get_model, draw_bbox_gaze
+from utils.helpers import get_model, jit_optimize, draw_bbox_gaze
 
 import uniface
 
@@ -67,7 +67,7 @@ def main(params):
     face_detector = uniface.RetinaFace()  # third-party face detection library
 
     try:
-        gaze_detector = get_model(params.model, params.bins, inference_mode=True)
+        gaze_detector = get_model(params.model, params.bins, inference_mode=True, wrap_inference=True)
         state_dict = torch.load(params.weight, map_location=device)
         gaze_detector.load_state_dict(state_dict)
         logging.info("Gaze Estimation model weights loaded.")
@@ -77,6 +77,12 @@ def main(params):
     gaze_detector.to(device)
     gaze_detector.eval()
 
+    try:
+        gaze_detector = jit_optimize(gaze_detector, device=device)
+        logging.info("Gaze Estimation model compiled with TorchScript.")
+    except Exception as e:
+        logging.info(f"TorchScript optimization failed, running eager. Exception: {e}")
+
     video_source = params.source
     if video_source.isdigit() or video_source == '0':
         cap = cv2.VideoCapture(int(video_source))
@@ -176,7 +176,7 @@ def main():
     torch.backends.cudnn.benchmark = True
 
     model, optimizer, start_epoch = initialize_model(params, device)
-    train_loader = get_dataloader(params, mode="train")
+    train_loader = get_dataloader(params, mode="train", device=device)
 
     cls_criterion = nn.CrossEntropyLoss()
     reg_criterion = nn.MSELoss()
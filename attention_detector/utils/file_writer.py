@@ -1,30 +1,141 @@
 import os
+import asyncio
 import threading
-from queue import Queue
 
-# Create a queue for percentage values
-percentage_queue = Queue()
+# aiofiles is optional; the async writer falls back to a plain inline
+# write (the payload is a handful of bytes) when it is not installed
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+# Single-slot "latest value" shared with the producer. A full Queue is
+# overkill here (mutex + condvar per put, unbounded growth if the disk
+# stalls): the writer only ever needs the most recent counts, so a
+# single slot plus an Event is enough. The producer hands over the raw
+# (looks, total) pair as one atomically-rebound tuple so the writer
+# never pairs a new looks with a stale total; the division and
+# formatting happen off the render thread, here in the writer.
+_latest = (0, 0)
+_evt = threading.Event()
+_stop = False
+
+
+class _PercentageSlot:
+    """Queue-like shim so callers can keep using percentage_queue.put()."""
+
+    def put(self, value):
+        global _latest, _stop
+        if value is None:
+            _stop = True
+        else:
+            _latest = (value[0], value[1])
+        _evt.set()
+
+
+percentage_queue = _PercentageSlot()
 
 # Worker thread function that writes percentages to file
 def percentage_writer():
-    while True:
-        # get percentage from queue (blocks until item available)
-        percentage = percentage_queue.get()
-        
-        if percentage is None:
-            break
-            
-        # write to file one up the dir
-        filepath = os.path.join('..', 'percentage.txt')
-        try:
-            with open(filepath, 'w') as f:
-                f.write(f"{percentage:.1f}")
-        except Exception as e:
-            print(f"Error writing to file: {e}")
-            
-        # done
-        percentage_queue.task_done()
+    # write to file one up the dir; keep the fd open across writes, but
+    # open lazily and re-open after failures or rotation so neither a
+    # bad open at startup nor a deleted file kills updates for good
+    filepath = os.path.join('..', 'percentage.txt')
+    fd = None
+
+    try:
+        while True:
+            # wait for a new value; intermediate values overwrite the
+            # slot, so backed-up producers never cost extra writes
+            _evt.wait()
+            _evt.clear()
+
+            if _stop:
+                break
+
+            try:
+                # single read of the rebound tuple; tear-free
+                looks, total = _latest
+                percentage = 100.0 * looks / total if total else 0.0
+                buf = f"{percentage:.1f}".encode()
+                # pwrite to an unlinked inode succeeds silently, so check
+                # the path still refers to our open file and re-open it
+                # after deletion/rotation
+                if fd is not None:
+                    try:
+                        stale = os.stat(filepath).st_ino != os.fstat(fd).st_ino
+                    except OSError:
+                        stale = True
+                    if stale:
+                        os.close(fd)
+                        fd = None
+                if fd is None:
+                    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT, 0o644)
+                os.pwrite(fd, buf, 0)
+                os.ftruncate(fd, len(buf))
+            except Exception as e:
+                print(f"Error writing to file: {e}")
+                if fd is not None:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+                    fd = None
+    finally:
+        if fd is not None:
+            os.close(fd)
 
 # Start worker thread
 writer_thread = threading.Thread(target=percentage_writer, daemon=True)
 writer_thread.start()
+
+
+class AsyncPercentageWriter:
+    """Percentage writer for pipelines that already run an event loop.
+
+    Avoids the dedicated OS thread: a maxsize-1 asyncio.Queue with
+    drop-old semantics gives the same latest-value behavior as the
+    threaded writer. Call everything from the loop's thread.
+    """
+
+    def __init__(self, filepath=os.path.join('..', 'percentage.txt')):
+        self.filepath = filepath
+        self._queue = asyncio.Queue(maxsize=1)
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._writer())
+        return self._task
+
+    def push(self, value):
+        # drop-old: only the latest (looks, total) pair matters
+        try:
+            self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        self._queue.put_nowait(value)
+
+    async def stop(self):
+        self.push(None)
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _writer(self):
+        while True:
+            value = await self._queue.get()
+            if value is None:
+                break
+
+            try:
+                looks, total = value
+                percentage = 100.0 * looks / total if total else 0.0
+                text = f"{percentage:.1f}"
+                if aiofiles is not None:
+                    async with aiofiles.open(self.filepath, 'w') as f:
+                        await f.write(text)
+                else:
+                    with open(self.filepath, 'w') as f:
+                        f.write(text)
+            except Exception as e:
+                print(f"Error writing to file: {e}")
@@ -1,13 +1,28 @@
+import array
+import math
+import os
+import platform
+import threading
+
 import cv2
 import numpy as np
 import torch
 import torch.nn as nn
 from torch.utils.data import DataLoader
+from torch.utils.data.dataloader import default_collate
 from torchvision import transforms
 from utils.file_writer import percentage_queue
 
 from utils.datasets import Gaze360, MPIIGaze
 
+# numba is optional: the batched gaze kernel is JIT-compiled when it is
+# installed and falls back to the plain Python loop otherwise
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 from models import (
     resnet18,
     resnet34,
@@ -20,39 +35,172 @@ from models import (
     mobileone_s4
 )
 
-looks_count = 0
-no_looks_count = 0
-total_faces = 0
-
-def get_model(arch, bins, pretrained=False, inference_mode=False):
-    """Return the model based on the specified architecture."""
-    if arch == 'resnet18':
-        model = resnet18(pretrained=pretrained, num_classes=bins)
-    elif arch == 'resnet34':
-        model = resnet34(pretrained=pretrained, num_classes=bins)
-    elif arch == 'resnet50':
-        model = resnet50(pretrained=pretrained, num_classes=bins)
-    elif arch == "mobilenetv2":
-        model = mobilenet_v2(pretrained=pretrained, num_classes=bins)
-    elif arch == "mobileone_s0":
-        model = mobileone_s0(pretrained=pretrained, num_classes=bins, inference_mode=inference_mode)
-    elif arch == "mobileone_s1":
-        model = mobileone_s1(pretrained=pretrained, num_classes=bins, inference_mode=inference_mode)
-    elif arch == "mobileone_s2":
-        model = mobileone_s2(pretrained=pretrained, num_classes=bins, inference_mode=inference_mode)
-    elif arch == "mobileone_s3":
-        model = mobileone_s3(pretrained=pretrained, num_classes=bins, inference_mode=inference_mode)
-    elif arch == "mobileone_s4":
-        model = mobileone_s4(pretrained=pretrained, num_classes=bins, inference_mode=inference_mode)
-    else:
+# architecture name -> constructor, so get_model dispatches in one lookup
+_ARCH_REGISTRY = {
+    'resnet18': resnet18,
+    'resnet34': resnet34,
+    'resnet50': resnet50,
+    'mobilenetv2': mobilenet_v2,
+    'mobileone_s0': mobileone_s0,
+    'mobileone_s1': mobileone_s1,
+    'mobileone_s2': mobileone_s2,
+    'mobileone_s3': mobileone_s3,
+    'mobileone_s4': mobileone_s4,
+}
+
+# attention counters: [total faces, looks, no-looks]; snapshotted and
+# updated under _stats_lock so detection threads don't race each other
+_stats = array.array('q', [0, 0, 0])
+_stats_lock = threading.Lock()
+
+# ImageNet normalization constants
+_MEAN = [0.485, 0.456, 0.406]
+_STD = [0.229, 0.224, 0.225]
+
+# Built once at import: reconstructing the pipeline (and the mean/std
+# tensors inside Normalize) on every get_dataloader call is wasted work
+_TRANSFORM = transforms.Compose([
+    transforms.Resize(448),
+    transforms.ToTensor(),
+    transforms.Normalize(mean=_MEAN, std=_STD)
+])
+
+# CUDA path: normalization is deferred to the GPU (see gpu_normalize),
+# so workers skip the per-sample float pass over every image
+_TRANSFORM_NO_NORM = transforms.Compose([
+    transforms.Resize(448),
+    transforms.ToTensor()
+])
+
+_MEAN_GPU = None
+_INV_STD_GPU = None
+
+
+def gpu_normalize(images):
+    """Normalize a batch in place on its device as fused (x - mean) * inv_std."""
+    global _MEAN_GPU, _INV_STD_GPU
+    if _MEAN_GPU is None or _MEAN_GPU.device != images.device:
+        _MEAN_GPU = torch.tensor(_MEAN, device=images.device).view(1, 3, 1, 1)
+        _INV_STD_GPU = 1.0 / torch.tensor(_STD, device=images.device).view(1, 3, 1, 1)
+    return images.sub_(_MEAN_GPU).mul_(_INV_STD_GPU)
+
+
+def _collate_channels_last(batch):
+    """Stack samples and lay batched images out channels-last for CPU convs."""
+    images, binned_labels, regression_labels, filenames = default_collate(batch)
+    images = images.contiguous(memory_format=torch.channels_last)
+    return images, binned_labels, regression_labels, filenames
+
+class InferenceWrapper(nn.Module):
+    """Run the wrapped model under inference_mode on channels-last input.
+
+    Saves callers from repeating torch.no_grad() and the memory-format
+    conversion at every call site; inference_mode is cheaper than
+    no_grad since it also skips version-counter bookkeeping.
+    """
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def load_state_dict(self, state_dict, **kwargs):
+        # keep accepting the inner model's checkpoints
+        return self.model.load_state_dict(state_dict, **kwargs)
+
+    def forward(self, x):
+        with torch.inference_mode():
+            return self.model(x.contiguous(memory_format=torch.channels_last))
+
+
+def get_model(arch, bins, pretrained=False, inference_mode=False, wrap_inference=False):
+    """Return the model based on the specified architecture.
+
+    With `wrap_inference=True` the model comes back in channels-last
+    memory format with forward running under torch.inference_mode().
+    """
+    try:
+        model_fn = _ARCH_REGISTRY[arch]
+    except KeyError:
         raise ValueError(f"Please choose available model architecture, currently chosen: {arch}")
+
+    kwargs = {'pretrained': pretrained, 'num_classes': bins}
+    if arch.startswith('mobileone'):
+        kwargs['inference_mode'] = inference_mode
+    model = model_fn(**kwargs)
+
+    if wrap_inference:
+        model = InferenceWrapper(model.eval().to(memory_format=torch.channels_last))
     return model
 
 
+def quantize_int8(model, calibration_loader=None, num_calibration_batches=10):
+    """Quantize a model to int8 for CPU inference.
+
+    Call after weights are loaded: quantization repacks the parameters,
+    so a quantized model can no longer accept an FP32 state dict. Static
+    FX quantization of the conv trunk needs representative data; without
+    a calibration loader only the linear heads are quantized.
+    """
+    from torch.ao.quantization import get_default_qconfig_mapping, quantize_dynamic
+    from torch.ao.quantization.quantize_fx import convert_fx, prepare_fx
+
+    backend = 'fbgemm' if platform.machine() in ('x86_64', 'AMD64') else 'qnnpack'
+    torch.backends.quantized.engine = backend
+    model.eval()
+
+    if calibration_loader is None:
+        return quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+
+    example_inputs = (torch.rand(1, 3, 448, 448),)
+    prepared = prepare_fx(model, get_default_qconfig_mapping(backend), example_inputs)
+    with torch.no_grad():
+        for idx, (images, *_) in enumerate(calibration_loader):
+            prepared(images)
+            if idx + 1 >= num_calibration_batches:
+                break
+    return convert_fx(prepared)
+
+
+def jit_optimize(model, device=None, input_size=448):
+    """Trace, freeze, and optimize a model for TorchScript inference.
+
+    Call after weights are loaded: freezing inlines the parameters, so a
+    frozen module can no longer accept a state dict.
+    """
+    if isinstance(model, InferenceWrapper):
+        # trace the inner model; the inference_mode context itself is
+        # not traceable, so rewrap around the frozen module
+        return InferenceWrapper(jit_optimize(model.model, device, input_size))
+
+    model.eval()
+    example = torch.rand(1, 3, input_size, input_size, device=device)
+    with torch.no_grad():
+        try:
+            scripted = torch.jit.trace(model, example)
+        except Exception:
+            # fall back for models with data-dependent control flow
+            scripted = torch.jit.script(model)
+    scripted = torch.jit.freeze(scripted.eval())
+    return torch.jit.optimize_for_inference(scripted)
+
+
 def angular_error(gaze_vector, label_vector):
-    dot_product = np.dot(gaze_vector, label_vector)
-    norm_product = np.linalg.norm(gaze_vector) * np.linalg.norm(label_vector)
-    cosine_similarity = min(dot_product / norm_product, 0.9999999)
+    # scalar math path: these are 3-element vectors, plain math avoids
+    # ndarray dispatch overhead per face per frame
+    dot_product = sum(g * l for g, l in zip(gaze_vector, label_vector))
+    norm_product = math.sqrt(sum(g * g for g in gaze_vector)) * math.sqrt(sum(l * l for l in label_vector))
+    # clamp both ends: FP rounding can push the ratio past +/-1 and
+    # math.acos raises outside its domain
+    cosine_similarity = max(min(dot_product / norm_product, 0.9999999), -1.0)
+
+    return math.degrees(math.acos(cosine_similarity))
+
+
+def angular_error_batch(gaze_vectors, label_vectors):
+    """Angular error in degrees for (N, 3) arrays of gaze/label vectors."""
+    dot_products = np.einsum('ij,ij->i', gaze_vectors, label_vectors)
+    norm_products = np.linalg.norm(gaze_vectors, axis=1) * np.linalg.norm(label_vectors, axis=1)
+    cosine_similarity = np.clip(dot_products / norm_products, -1.0, 0.9999999)
 
     return np.degrees(np.arccos(cosine_similarity))
 
@@ -61,22 +209,67 @@ def gaze_to_3d(gaze):
     yaw = gaze[0]   # Horizontal angle
     pitch = gaze[1]  # Vertical angle
 
-    gaze_vector = np.zeros(3)
-    gaze_vector[0] = -np.cos(pitch) * np.sin(yaw)
-    gaze_vector[1] = -np.sin(pitch)
-    gaze_vector[2] = -np.cos(pitch) * np.cos(yaw)
-
-    return gaze_vector
-
-
-def get_dataloader(params,  mode="train"):
-    """Load dataset and return DataLoader."""
-
-    transform = transforms.Compose([
-        transforms.Resize(448),
-        transforms.ToTensor(),
-        transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
-    ])
+    cos_pitch = math.cos(pitch)
+    return np.array([-cos_pitch * math.sin(yaw), -math.sin(pitch), -cos_pitch * math.cos(yaw)])
+
+
+class CudaPrefetcher:
+    """Wrap a DataLoader and stage batches on the GPU via a side stream.
+
+    The next batch is copied with non_blocking transfers while the
+    current one is being consumed, hiding host-to-device latency.
+    """
+
+    def __init__(self, loader, device, normalize=False):
+        self.loader = loader
+        self.device = device
+        self.normalize = normalize
+        self.stream = torch.cuda.Stream(device=device)
+
+    def __len__(self):
+        return len(self.loader)
+
+    def _preload(self):
+        try:
+            batch = next(self._iterator)
+        except StopIteration:
+            self._next_batch = None
+            return
+        with torch.cuda.stream(self.stream):
+            staged = [
+                item.to(self.device, non_blocking=True) if isinstance(item, torch.Tensor) else item
+                for item in batch
+            ]
+            if self.normalize:
+                staged[0] = gpu_normalize(staged[0])
+            self._next_batch = tuple(staged)
+
+    def __iter__(self):
+        self._iterator = iter(self.loader)
+        self._preload()
+        while self._next_batch is not None:
+            # make sure the copies issued on the side stream are done
+            current = torch.cuda.current_stream()
+            current.wait_stream(self.stream)
+            batch = self._next_batch
+            # the tensors were allocated on the side stream; mark them as
+            # used by the current stream so the caching allocator does not
+            # hand their memory back to a later _preload copy while the
+            # consumer is still reading them
+            for item in batch:
+                if isinstance(item, torch.Tensor):
+                    item.record_stream(current)
+            self._preload()
+            yield batch
+
+
+def get_dataloader(params,  mode="train", device=None):
+    """Load dataset and return DataLoader, prefetching to `device` if CUDA."""
+
+    # on CUDA the prefetcher normalizes the whole batch on device, so
+    # workers can skip Normalize entirely
+    use_cuda = device is not None and torch.device(device).type == "cuda"
+    transform = _TRANSFORM_NO_NORM if use_cuda else _TRANSFORM
 
     if params.dataset == "gaze360":
         dataset = Gaze360(params.data, transform, angle=params.angle, binwidth=params.binwidth, mode=mode)
@@ -85,18 +278,39 @@ def get_dataloader(params,  mode="train"):
     else:
         raise ValueError("Supported dataset are `gaze360` and `mpiigaze`")
 
+    # auto-size workers when unset; keep them alive across epochs and
+    # prefetch ahead so the GPU never waits on worker spin-up
+    num_workers = params.num_workers if params.num_workers is not None else min(8, os.cpu_count() or 2)
+
     data_loader = DataLoader(
         dataset=dataset,
         batch_size=params.batch_size,
         shuffle=True if mode == "train" else False,
-        num_workers=params.num_workers,
-        pin_memory=True
+        num_workers=num_workers,
+        pin_memory=True,
+        persistent_workers=num_workers > 0,
+        prefetch_factor=4 if num_workers > 0 else None,
+        drop_last=True if mode == "train" else False,
+        collate_fn=_collate_channels_last
     )
+
+    if use_cuda:
+        return CudaPrefetcher(data_loader, device, normalize=True)
     return data_loader
 
 
+def ensure_bgr(frame):
+    """Convert grayscale frames to BGR; hoist this once per frame, not per face."""
+    if frame.ndim == 3 and frame.shape[2] == 3:
+        return frame
+    return cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+
+
 def draw_gaze(frame, bbox, pitch, yaw, attention_threshold=0.20, thickness=2):
-    """Draws gaze direction on a frame given bounding box and gaze angles."""
+    """Draws gaze direction on a frame given bounding box and gaze angles.
+
+    Expects a BGR frame; run grayscale sources through ensure_bgr first.
+    """
     # unpack bbox coords
     x_min, y_min, x_max, y_max = map(int, bbox[:4])
 
@@ -104,20 +318,25 @@ def draw_gaze(frame, bbox, pitch, yaw, attention_threshold=0.20, thickness=2):
     x_center = (x_min + x_max) // 2
     y_center = (y_min + y_max) // 2
 
-    # handle grayscale frames
-    if len(frame.shape) == 2 or frame.shape[2] == 1:
-        frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-
-    # calc gaze dir
+    # calc gaze dir; plain math avoids ndarray dispatch per face
+    pitch, yaw = float(pitch), float(yaw)
     length = x_max - x_min
-    dx = int(-length * np.sin(pitch) * np.cos(yaw))
-    dy = int(-length * np.sin(yaw))
+    dx = int(-length * math.sin(pitch) * math.cos(yaw))
+    dy = int(-length * math.sin(yaw))
+
+    # compare squared deviation against squared thresh to skip the sqrt;
+    # int result lets callers accumulate counters branchlessly
+    is_looking = int(pitch * pitch + yaw * yaw <= attention_threshold * attention_threshold)
 
-    # calc angular dev from camera
-    deviation = np.sqrt(pitch**2 + yaw**2)
-    
+    _draw_gaze_overlay(frame, x_min, y_min, x_center, y_center, dx, dy, is_looking, thickness)
+
+    return is_looking  # 1 if looking at ad else 0
+
+
+def _draw_gaze_overlay(frame, x_min, y_min, x_center, y_center, dx, dy, is_looking, thickness=2):
+    """Draw the attention label, center dot, and gaze arrow for one face."""
     # set color based on thresh
-    if deviation <= attention_threshold:
+    if is_looking:
         color = (0, 255, 0)  # green: looking at cam
         text = "Looking at Ad"
     else:
@@ -141,8 +360,24 @@ def draw_gaze(frame, bbox, pitch, yaw, attention_threshold=0.20, thickness=2):
         line_type=cv2.LINE_AA,
         tipLength=0.25
     )
-    
-    return deviation <= attention_threshold  # ret if looking at ad
+
+
+def _hline(image, y, x0, x1, thickness, color):
+    """Paint a horizontal stroke by slice assignment (centered like cv2.line)."""
+    height, width = image.shape[:2]
+    y -= thickness // 2
+    y0, y1 = max(y, 0), min(y + thickness, height)
+    x0, x1 = max(x0, 0), min(x1, width)
+    image[y0:y1, x0:x1] = color
+
+
+def _vline(image, x, y0, y1, thickness, color):
+    """Paint a vertical stroke by slice assignment (centered like cv2.line)."""
+    height, width = image.shape[:2]
+    x -= thickness // 2
+    x0, x1 = max(x, 0), min(x + thickness, width)
+    y0, y1 = max(y0, 0), min(y1, height)
+    image[y0:y1, x0:x1] = color
 
 
 def draw_bbox(image, bbox, color=(0, 255, 0), thickness=2, proportion=0.2):
@@ -157,72 +392,183 @@ def draw_bbox(image, bbox, color=(0, 255, 0), thickness=2, proportion=0.2):
     # draw rect
     cv2.rectangle(image, (x_min, y_min), (x_max, y_max), color, 1)
 
+    # corner accents are axis-aligned, so paint them with direct slice
+    # stores instead of going through the cv2 drawing pipeline
+
     # top-left
-    cv2.line(image, (x_min, y_min), (x_min + corner_length, y_min), color, thickness)
-    cv2.line(image, (x_min, y_min), (x_min, y_min + corner_length), color, thickness)
+    _hline(image, y_min, x_min, x_min + corner_length, thickness, color)
+    _vline(image, x_min, y_min, y_min + corner_length, thickness, color)
 
     # top-right
-    cv2.line(image, (x_max, y_min), (x_max - corner_length, y_min), color, thickness)
-    cv2.line(image, (x_max, y_min), (x_max, y_min + corner_length), color, thickness)
+    _hline(image, y_min, x_max - corner_length, x_max, thickness, color)
+    _vline(image, x_max, y_min, y_min + corner_length, thickness, color)
 
     # bottom-left
-    cv2.line(image, (x_min, y_max), (x_min, y_max - corner_length), color, thickness)
-    cv2.line(image, (x_min, y_max), (x_min + corner_length, y_max), color, thickness)
+    _hline(image, y_max, x_min, x_min + corner_length, thickness, color)
+    _vline(image, x_min, y_max - corner_length, y_max, thickness, color)
 
     # bottom-right
-    cv2.line(image, (x_max, y_max), (x_max, y_max - corner_length), color, thickness)
-    cv2.line(image, (x_max, y_max), (x_max - corner_length, y_max), color, thickness)
+    _hline(image, y_max, x_max - corner_length, x_max, thickness, color)
+    _vline(image, x_max, y_max - corner_length, y_max, thickness, color)
 
 
 def draw_bbox_gaze(frame: np.ndarray, bbox, pitch, yaw, attention_threshold=0.20):
     """Draws bbox and gaze dir."""
-    global looks_count, no_looks_count, total_faces
-    
+    # handle grayscale sources once per frame
+    frame = ensure_bgr(frame)
+
     # draw bbox
     draw_bbox(frame, bbox)
-    
+
     # draw gaze and get attn state
     is_looking = draw_gaze(frame, bbox, pitch, yaw, attention_threshold)
-    
-    # update counters
-    total_faces += 1
-    if is_looking:
-        looks_count += 1
-    else:
-        no_looks_count += 1
-    
-    return is_looking
+
+    # update counters under one lock acquisition, branchlessly
+    with _stats_lock:
+        _stats[0] += 1
+        _stats[1] += is_looking
+        _stats[2] += 1 - is_looking
+
+    return bool(is_looking)
+
+
+def _gaze_geometry(bboxes, pitches, yaws, attention_threshold):
+    """Batch kernel: centers, arrow deltas, and attention flags per face."""
+    n = bboxes.shape[0]
+    centers = np.empty((n, 2), dtype=np.int64)
+    deltas = np.empty((n, 2), dtype=np.int64)
+    looking = np.empty(n, dtype=np.bool_)
+
+    for i in prange(n):
+        x_min = bboxes[i, 0]
+        y_min = bboxes[i, 1]
+        x_max = bboxes[i, 2]
+        y_max = bboxes[i, 3]
+        pitch = pitches[i]
+        yaw = yaws[i]
+
+        centers[i, 0] = int((x_min + x_max) // 2)
+        centers[i, 1] = int((y_min + y_max) // 2)
+
+        length = x_max - x_min
+        deltas[i, 0] = int(-length * math.sin(pitch) * math.cos(yaw))
+        deltas[i, 1] = int(-length * math.sin(yaw))
+
+        looking[i] = pitch * pitch + yaw * yaw <= attention_threshold * attention_threshold
+
+    return centers, deltas, looking
+
+
+if njit is not None:
+    _gaze_geometry = njit(cache=True, fastmath=True, parallel=True)(_gaze_geometry)
+
+
+def draw_bbox_gaze_batch(frame: np.ndarray, bboxes, pitches, yaws, attention_threshold=0.20):
+    """Draws bboxes and gaze dirs for a whole frame of faces.
+
+    The per-face arithmetic runs as one batch through _gaze_geometry
+    (JIT-compiled when numba is installed); only the drawing calls stay
+    in Python.
+    """
+    # handle grayscale sources once per frame
+    frame = ensure_bgr(frame)
+
+    bboxes = np.ascontiguousarray(bboxes, dtype=np.float64)
+    pitches = np.ascontiguousarray(pitches, dtype=np.float64).ravel()
+    yaws = np.ascontiguousarray(yaws, dtype=np.float64).ravel()
+
+    centers, deltas, looking = _gaze_geometry(bboxes, pitches, yaws, attention_threshold)
+
+    for i in range(bboxes.shape[0]):
+        draw_bbox(frame, bboxes[i])
+        _draw_gaze_overlay(
+            frame,
+            int(bboxes[i, 0]), int(bboxes[i, 1]),
+            int(centers[i, 0]), int(centers[i, 1]),
+            int(deltas[i, 0]), int(deltas[i, 1]),
+            bool(looking[i])
+        )
+
+    # update counters once for the whole frame
+    num_faces = bboxes.shape[0]
+    num_looks = int(np.count_nonzero(looking))
+    with _stats_lock:
+        _stats[0] += num_faces
+        _stats[1] += num_looks
+        _stats[2] += num_faces - num_looks
+
+    return looking
+
+# Static part of the stats panel (background + labels), rendered once.
+# putText is a heavy rasterizer and the labels never change, so only the
+# numeric values are drawn per frame.
+_STATS_LABELS = [
+    ("Total Faces:", (255, 255, 255)),
+    ("Looking Count:", (0, 255, 0)),
+    ("Not Looking:", (0, 0, 255)),
+    ("Looking %:", (255, 255, 0)),
+]
+_stats_overlay = None
+_stats_value_x = 0
+
+# last (looks, total) handed to the writer; most frames add no faces,
+# so skipping unchanged values drops most disk writes entirely
+_last_pushed = None
+
+
+def _build_stats_overlay():
+    """Render the bg rect and static labels into a cached 120x300 sprite."""
+    global _stats_overlay, _stats_value_x
+
+    overlay = np.zeros((120, 300, 3), dtype=np.uint8)
+    y_pos = 30
+    value_x = 0
+    for text, color in _STATS_LABELS:
+        # labels rasterize exactly once, so anti-aliasing costs nothing
+        cv2.putText(overlay, text, (10, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2, cv2.LINE_AA)
+        (text_width, _), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)
+        value_x = max(value_x, 10 + text_width + 8)
+        y_pos += 30
+
+    _stats_overlay = overlay
+    _stats_value_x = value_x
+
 
 def draw_stats(frame):
     """Draw stats in top right corner"""
-    global percentage_queue
-    
+    global _last_pushed
+
     height, width = frame.shape[:2]
-    
+
+    # snapshot counters so the percentage and the drawn values agree
+    with _stats_lock:
+        total_faces, looks_count, no_looks_count = _stats
+
     # calc percentage
     looking_percentage = 0
     if total_faces > 0:
         looking_percentage = (looks_count / total_faces) * 100
-    
-    # Add percentage to queue for writing
-    percentage_queue.put(looking_percentage)
-    
-    # bg rect for readability
-    cv2.rectangle(frame, (width-300, 0), (width, 120), (0, 0, 0), -1)
-    
-    # stats text
+
+    # hand the raw counts to the writer (it divides and formats), and
+    # only when they changed since the last push
+    if (looks_count, total_faces) != _last_pushed:
+        percentage_queue.put((looks_count, total_faces))
+        _last_pushed = (looks_count, total_faces)
+
+    if _stats_overlay is None:
+        _build_stats_overlay()
+
+    # blit the pre-rendered panel, clipped to the frame bounds so small
+    # frames degrade gracefully like the old putText calls did
+    panel_height, panel_width = _stats_overlay.shape[:2]
+    x_start = max(width - panel_width, 0)
+    blit_height = min(panel_height, height)
+    frame[:blit_height, x_start:width] = _stats_overlay[:blit_height, :width - x_start]
+
+    # then draw only the changing numbers
+    values = [str(total_faces), str(looks_count), str(no_looks_count), f"{looking_percentage:.1f}%"]
+    x_pos = x_start + _stats_value_x
     y_pos = 30
-    cv2.putText(frame, f"Total Faces: {total_faces}", 
-                (width-290, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-    
-    y_pos += 30
-    cv2.putText(frame, f"Looking Count: {looks_count}", 
-                (width-290, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-    
-    y_pos += 30
-    cv2.putText(frame, f"Not Looking: {no_looks_count}", 
-                (width-290, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-    
-    y_pos += 30
-    cv2.putText(frame, f"Looking %: {looking_percentage:.1f}%", 
-                (width-290, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+    for value, (_, color) in zip(values, _STATS_LABELS):
+        cv2.putText(frame, value, (x_pos, y_pos), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+        y_pos += 30